@@ -8,7 +8,7 @@ Old approach (pure random noise) had autocorrelation ~0 = unlearnable.
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 FEATURE_NAMES = [
     "cpu_usage",
@@ -175,6 +175,14 @@ def get_live_sample(force_anomaly=False):
     return sample
 
 
+def timestamp_to_epoch(timestamp):
+    """ISO timestamp → epoch seconds. Naive values are UTC, like utcnow() above."""
+    dt = datetime.fromisoformat(timestamp)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
 def _compute_severity(sample):
     normal_stats = {
         "cpu_usage":       (45.0, 10.0),
@@ -0,0 +1,184 @@
+"""
+fleet.py
+--------
+Incremental per-node and fleet-wide aggregates.
+Every update is O(1): Welford running mean/variance per feature,
+anomaly counts per type, and 1m/15m/1h rates from bucketed ring counters.
+Memory and cost stay constant no matter how long the stream runs.
+"""
+
+import math
+import time
+from data_generator import FEATURE_NAMES, timestamp_to_epoch
+
+# window name → (bucket seconds, number of buckets)
+WINDOWS = {
+    "1m":  (1,  60),
+    "15m": (15, 60),
+    "1h":  (60, 60),
+}
+
+
+class Welford:
+    """Running mean / variance (Welford's online algorithm)."""
+    def __init__(self):
+        self.n    = 0
+        self.mean = 0.0
+        self.m2   = 0.0
+
+    def update(self, x):
+        self.n    += 1
+        delta      = x - self.mean
+        self.mean += delta / self.n
+        self.m2   += delta * (x - self.mean)
+
+    @property
+    def variance(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def as_dict(self):
+        return {
+            "mean": round(self.mean, 6),
+            "std":  round(math.sqrt(self.variance), 6),
+        }
+
+
+class RateWindow:
+    """
+    Sliding-window point/anomaly counts over a ring of time buckets.
+    Buckets are keyed by timestamp (seconds); advancing the head clears at most
+    `n_buckets` slots, so updates and reads are O(1) amortised.
+    """
+    def __init__(self, bucket_s, n_buckets):
+        self.bucket_s  = bucket_s
+        self.n_buckets = n_buckets
+        self.points    = [0] * n_buckets
+        self.anomalies = [0] * n_buckets
+        self.head      = None     # absolute index of the newest bucket
+        self.total_pts = 0
+        self.total_anm = 0
+
+    def _advance(self, idx):
+        if self.head is None:
+            self.head = idx
+            return
+        steps = min(idx - self.head, self.n_buckets)
+        for k in range(1, steps + 1):
+            slot = (self.head + k) % self.n_buckets
+            self.total_pts -= self.points[slot]
+            self.total_anm -= self.anomalies[slot]
+            self.points[slot] = self.anomalies[slot] = 0
+        self.head = max(self.head, idx)
+
+    def update(self, ts, is_anomaly):
+        idx = int(ts // self.bucket_s)
+        self._advance(idx)
+        if idx <= self.head - self.n_buckets:
+            return  # older than the window — drop
+        slot = idx % self.n_buckets
+        self.points[slot] += 1
+        self.total_pts    += 1
+        if is_anomaly:
+            self.anomalies[slot] += 1
+            self.total_anm       += 1
+
+    def as_dict(self, now):
+        self._advance(int(now // self.bucket_s))
+        return {
+            "points":       self.total_pts,
+            "anomalies":    self.total_anm,
+            "anomaly_rate": round(self.total_anm / max(self.total_pts, 1) * 100, 2),
+        }
+
+
+class NodeAggregate:
+    """Lifetime + windowed aggregates for one node (or the whole fleet)."""
+    def __init__(self):
+        self.points       = 0
+        self.anomalies    = 0
+        self.anomaly_rate = 0.0
+        self.by_type      = {}
+        self.features     = {f: Welford() for f in FEATURE_NAMES}
+        self.windows      = {name: RateWindow(*cfg) for name, cfg in WINDOWS.items()}
+        self.last         = {}
+        self.last_seen    = None
+        self._last_ts     = None
+
+    def update(self, sample, is_anomaly, ts):
+        self.points += 1
+        for f in FEATURE_NAMES:
+            self.features[f].update(sample[f])
+        if is_anomaly:
+            self.anomalies += 1
+            # Model-flagged points the generator labelled normal have no type
+            atype = sample["anomaly_type"]
+            atype = "unlabelled" if atype == "normal" else atype
+            self.by_type[atype] = self.by_type.get(atype, 0) + 1
+        self.anomaly_rate = round(self.anomalies / self.points * 100, 2)
+        for w in self.windows.values():
+            w.update(ts, is_anomaly)
+
+        if self._last_ts is None or ts >= self._last_ts:
+            self._last_ts  = ts
+            self.last_seen = sample["timestamp"]
+            self.last      = {f: sample[f] for f in FEATURE_NAMES}
+            self.last["is_anomaly"] = bool(is_anomaly)
+
+    def totals(self):
+        return {
+            "total_points":    self.points,
+            "total_anomalies": self.anomalies,
+            "anomaly_rate":    self.anomaly_rate,
+        }
+
+    def as_dict(self, now):
+        return {
+            **self.totals(),
+            "anomalies_by_type": dict(self.by_type),
+            "features":        {f: w.as_dict() for f, w in self.features.items()},
+            "windows":         {name: w.as_dict(now) for name, w in self.windows.items()},
+            "last":            dict(self.last),
+            "last_seen":       self.last_seen,
+        }
+
+
+class FleetAggregator:
+    """
+    Per-node and fleet-wide aggregates, fed once per scored point.
+
+    event_time=False (live): windows are keyed by wall-clock arrival time
+    and read at the current time, so they drain when the stream goes idle.
+    event_time=True (replay): windows are keyed by the recorded timestamps
+    and read at the newest one seen, i.e. on the recording's own timeline.
+    Use one aggregator per timeline — mixing them would drop points.
+    """
+    def __init__(self, event_time=False):
+        self.event_time = event_time
+        self.fleet      = NodeAggregate()
+        self.nodes      = {}
+        self.clock      = None
+
+    def update(self, sample, is_anomaly, ts=None):
+        """ts: the sample's epoch seconds if the caller already parsed it."""
+        if self.event_time:
+            ts = ts if ts is not None else timestamp_to_epoch(sample["timestamp"])
+        else:
+            ts = time.time()
+        self.clock = ts if self.clock is None else max(self.clock, ts)
+
+        node = self.nodes.get(sample["node_id"])
+        if node is None:
+            node = self.nodes[sample["node_id"]] = NodeAggregate()
+
+        node.update(sample, is_anomaly, ts)
+        self.fleet.update(sample, is_anomaly, ts)
+
+    def summary(self):
+        if self.event_time:
+            now = self.clock or 0.0
+        else:
+            now = time.time()
+        return {
+            "fleet": self.fleet.as_dict(now),
+            "nodes": {nid: n.as_dict(now) for nid, n in sorted(self.nodes.items())},
+        }
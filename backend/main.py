@@ -11,6 +11,8 @@ import json
 import pickle
 import io
 import csv
+import itertools
+import math
 from datetime import datetime
 from collections import deque
 
@@ -23,6 +25,8 @@ from fastapi.responses import StreamingResponse, JSONResponse
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from data_generator import get_live_sample, FEATURE_NAMES
 from model import LSTMAutoencoder, AnomalyDetector
+from replay import replay, check_header, ReplayStats
+from fleet import FleetAggregator
 
 # ──────── CONFIG ────────
 MODEL_PATH  = "../models/lstm_autoencoder.pth"
@@ -30,6 +34,8 @@ SCALER_PATH = "../models/scaler.pkl"
 SEQ_LEN     = 30
 STREAM_HZ   = 0.5
 MAX_HISTORY = 500
+REPLAY_DIR  = "../data"
+FLEET_HZ    = 5.0
 # ────────────────────────
 
 app = FastAPI(title="NetPulse API", version="1.0.0")
@@ -47,9 +53,12 @@ scaler            = None
 sequence_buffer   = deque(maxlen=SEQ_LEN)
 anomaly_log       = deque(maxlen=MAX_HISTORY)
 connected_clients = []
+replay_task       = None
+replay_stats      = None
+fleet             = FleetAggregator()
+replay_fleet      = None
+anomaly_ids       = itertools.count(1)
 stats = {
-    "total_points":    0,
-    "total_anomalies": 0,
     "model_loaded":    False
 }
 
@@ -109,6 +118,40 @@ def _score_sample(raw_sample):
     return result
 
 
+def _active_fleet():
+    """Replay aggregates while a replay runs, live aggregates otherwise."""
+    if replay_task and not replay_task.done():
+        return replay_fleet
+    return fleet
+
+
+def _build_payload(raw, agg, timeline, ts=None):
+    """Score one raw sample, update aggregates/anomaly log, return the WS payload."""
+    scores = _score_sample(raw)
+    payload = {**raw, **scores, "timeline": timeline}
+    agg.update(raw, scores["is_anomaly"], ts)
+
+    if scores["is_anomaly"]:
+        log_entry = {
+            "id":                   next(anomaly_ids),
+            "timestamp":            raw["timestamp"],
+            "node_id":              raw["node_id"],
+            "anomaly_type":         raw["anomaly_type"],
+            "anomaly_score":        round(scores["anomaly_score"], 1),
+            "reconstruction_error": round(scores["reconstruction_error"], 6),
+            "cpu_usage":            round(raw["cpu_usage"], 1),
+            "latency_ms":           round(raw["latency_ms"], 1),
+            "packet_loss_pct":      round(raw["packet_loss_pct"], 2),
+            "timeline":             timeline,
+        }
+        anomaly_log.append(log_entry)
+        payload["log_entry"] = log_entry
+
+    payload["stats"] = agg.fleet.totals()
+
+    return payload
+
+
 @app.websocket("/ws/telemetry")
 async def telemetry_ws(websocket: WebSocket):
     await websocket.accept()
@@ -117,35 +160,12 @@ async def telemetry_ws(websocket: WebSocket):
 
     try:
         while True:
-            raw    = get_live_sample()
-            scores = _score_sample(raw)
-            payload = {**raw, **scores}
-            stats["total_points"] += 1
-
-            if scores["is_anomaly"]:
-                stats["total_anomalies"] += 1
-                log_entry = {
-                    "id":                   stats["total_anomalies"],
-                    "timestamp":            raw["timestamp"],
-                    "node_id":              raw["node_id"],
-                    "anomaly_type":         raw["anomaly_type"],
-                    "anomaly_score":        round(scores["anomaly_score"], 1),
-                    "reconstruction_error": round(scores["reconstruction_error"], 6),
-                    "cpu_usage":            round(raw["cpu_usage"], 1),
-                    "latency_ms":           round(raw["latency_ms"], 1),
-                    "packet_loss_pct":      round(raw["packet_loss_pct"], 2),
-                }
-                anomaly_log.append(log_entry)
-                payload["log_entry"] = log_entry
-
-            payload["stats"] = {
-                "total_points":    stats["total_points"],
-                "total_anomalies": stats["total_anomalies"],
-                "anomaly_rate":    round(
-                    stats["total_anomalies"] / max(stats["total_points"], 1) * 100, 2
-                ),
-            }
+            if replay_task and not replay_task.done():
+                # Replay owns the stream — points arrive via _broadcast()
+                await asyncio.sleep(STREAM_HZ)
+                continue
 
+            payload = _build_payload(get_live_sample(), fleet, "live")
             await websocket.send_text(json.dumps(payload, default=str))
             await asyncio.sleep(STREAM_HZ)
 
@@ -158,6 +178,88 @@ async def telemetry_ws(websocket: WebSocket):
             connected_clients.remove(websocket)
 
 
+@app.websocket("/ws/fleet")
+async def fleet_ws(websocket: WebSocket):
+    """Low-rate channel pushing the fleet summary every FLEET_HZ seconds."""
+    await websocket.accept()
+    try:
+        while True:
+            await websocket.send_text(json.dumps(_fleet_summary(), default=str))
+            await asyncio.sleep(FLEET_HZ)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Fleet WebSocket error: {e}")
+
+
+async def _broadcast(raw, ts):
+    """Score one replayed sample and push it to every connected client."""
+    message = json.dumps(_build_payload(raw, replay_fleet, "replay", ts), default=str)
+    for ws in list(connected_clients):
+        try:
+            await ws.send_text(message)
+        except Exception:
+            if ws in connected_clients:
+                connected_clients.remove(ws)
+
+
+async def _run_replay(path, speed, live_buffer):
+    """Run a replay, then hand the LSTM window back to the live stream."""
+    try:
+        await replay(path, _broadcast, speed=speed, stats=replay_stats)
+        print(f"Replay finished | {replay_stats.as_dict()}")
+    except asyncio.CancelledError:
+        print("Replay stopped")
+    except Exception as e:
+        print(f"Replay error: {e}")
+    finally:
+        sequence_buffer.clear()
+        sequence_buffer.extend(live_buffer)
+
+
+@app.post("/api/replay/start")
+async def start_replay(file: str = "train_data.csv", speed: float = 1.0):
+    """speed: 1 = recorded timing, N = N× faster, 0 = as fast as possible."""
+    global replay_task, replay_stats, replay_fleet
+
+    if replay_task and not replay_task.done():
+        return JSONResponse({"message": "Replay already running"}, status_code=409)
+    if not (math.isfinite(speed) and speed >= 0):
+        return JSONResponse({"message": "speed must be a finite number >= 0"}, status_code=400)
+
+    root = os.path.realpath(REPLAY_DIR)
+    path = os.path.realpath(os.path.join(root, file))
+    if os.path.dirname(path) != root or not os.path.isfile(path):
+        return JSONResponse({"message": f"Recording not found: {file}"}, status_code=404)
+    try:
+        check_header(path)
+    except ValueError as e:
+        return JSONResponse({"message": str(e)}, status_code=400)
+
+    replay_stats = ReplayStats(path, speed)
+    replay_fleet = FleetAggregator(event_time=True)
+    # Replayed rows must not be scored against live samples (or vice versa)
+    live_buffer  = list(sequence_buffer)
+    sequence_buffer.clear()
+    replay_task  = asyncio.create_task(_run_replay(path, speed, live_buffer))
+    return {"message": "Replay started", "file": file, "speed": speed}
+
+
+@app.post("/api/replay/stop")
+async def stop_replay():
+    if not replay_task or replay_task.done():
+        return JSONResponse({"message": "No replay running"}, status_code=404)
+    replay_task.cancel()
+    return {"message": "Replay stopping"}
+
+
+@app.get("/api/replay/status")
+async def get_replay_status():
+    if replay_stats is None:
+        return {"running": False}
+    return replay_stats.as_dict()
+
+
 @app.get("/api/status")
 async def get_status():
     return {
@@ -165,12 +267,33 @@ async def get_status():
         "model_loaded":      stats["model_loaded"],
         "threshold":         float(detector.threshold) if detector else None,
         "connected_clients": len(connected_clients),
-        "stats":             stats,
+        "stats":             {**_active_fleet().fleet.totals(), **stats},
         "features":          FEATURE_NAMES,
         "seq_len":           SEQ_LEN,
     }
 
 
+def _fleet_summary(timeline=None):
+    """Summary for `timeline` ("live" / "replay"), default the active one."""
+    if timeline is None:
+        agg = _active_fleet()
+    else:
+        agg = replay_fleet if timeline == "replay" else fleet
+    if agg is None:
+        return None
+    return {"timeline": "replay" if agg is replay_fleet else "live", **agg.summary()}
+
+
+@app.get("/api/fleet/summary")
+async def get_fleet_summary(timeline: str = None):
+    if timeline not in (None, "live", "replay"):
+        return JSONResponse({"message": "timeline must be live or replay"}, status_code=400)
+    summary = _fleet_summary(timeline)
+    if summary is None:
+        return JSONResponse({"message": "No replay has run yet"}, status_code=404)
+    return summary
+
+
 @app.get("/api/anomalies")
 async def get_anomalies(limit: int = 50):
     log = list(anomaly_log)[-limit:]
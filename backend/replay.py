@@ -0,0 +1,183 @@
+"""
+replay.py
+---------
+Recorded telemetry replay — streams a CSV in the training data format
+through the live scoring/broadcast path at 1x, Nx or max speed.
+Rows are read by a background thread into a bounded read-ahead queue,
+so files of any size replay without being loaded into memory.
+"""
+
+import csv
+import queue
+import threading
+import asyncio
+import time
+
+from data_generator import FEATURE_NAMES, timestamp_to_epoch, _compute_severity
+
+READ_AHEAD = 256      # rows buffered ahead of playback
+N_NODES    = 6        # round-robin node assignment when file has no node_id
+_EOF       = object()
+
+
+def _parse_row(row, index):
+    """CSV row (all strings) → sample dict shaped like get_live_sample()."""
+    sample = {f: float(row[f]) for f in FEATURE_NAMES}
+    is_anomaly = (row.get("is_anomaly") or "0").strip().lower() in ("1", "true")
+
+    sample["is_anomaly"]   = is_anomaly
+    sample["anomaly_type"] = row.get("anomaly_type") or ("unknown" if is_anomaly else "normal")
+    sample["severity"]     = _compute_severity(sample) if is_anomaly else 0.0
+    sample["timestamp"]    = row["timestamp"]
+    sample["node_id"]      = row.get("node_id") or f"NODE-{(index % N_NODES) + 1:02d}"
+    return sample
+
+
+def check_header(path):
+    """Raise ValueError if the CSV at `path` lacks the columns replay needs."""
+    with open(path, newline="") as f:
+        header = next(csv.reader(f), [])
+    missing = [c for c in FEATURE_NAMES + ["timestamp"] if c not in header]
+    if missing:
+        raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+
+
+class RecordingReader:
+    """
+    Streaming CSV reader with read-ahead.
+    A daemon thread parses rows into a bounded queue; the consumer pulls
+    them in file order as (read_at, sample) pairs, read_at being the
+    monotonic time the row came off disk. Parse errors are re-raised on
+    the consumer side.
+    """
+    def __init__(self, path, read_ahead=READ_AHEAD):
+        self.path     = path
+        self._queue   = queue.Queue(maxsize=read_ahead)
+        self._stop    = threading.Event()
+        self._thread  = threading.Thread(target=self._fill, daemon=True)
+
+        check_header(path)
+        self._thread.start()
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fill(self):
+        try:
+            with open(self.path, newline="") as f:
+                for i, row in enumerate(csv.DictReader(f)):
+                    if not self._put((time.monotonic(), _parse_row(row, i))):
+                        return
+        except Exception as e:
+            self._put(e)
+            return
+        self._put(_EOF)
+
+    def close(self):
+        self._stop.set()
+
+    async def __aiter__(self):
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                try:
+                    item = await asyncio.to_thread(self._queue.get, True, 0.5)
+                except queue.Empty:
+                    continue
+            if item is _EOF:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+class ReplayStats:
+    """End-to-end lag and sustained throughput for one replay run."""
+    def __init__(self, path, speed):
+        self.path           = path
+        self.speed          = speed
+        self.started_at     = time.monotonic()
+        self.finished_at    = None
+        self.points         = 0
+        self.lag_total_ms   = 0.0
+        self.lag_max_ms     = 0.0
+        self.queue_total_ms = 0.0
+        self.queue_max_ms   = 0.0
+        self.error          = None
+
+    def record(self, lag_ms, queue_ms):
+        self.points         += 1
+        self.lag_total_ms   += lag_ms
+        self.lag_max_ms      = max(self.lag_max_ms, lag_ms)
+        self.queue_total_ms += queue_ms
+        self.queue_max_ms    = max(self.queue_max_ms, queue_ms)
+
+    def as_dict(self):
+        end     = self.finished_at or time.monotonic()
+        elapsed = max(end - self.started_at, 1e-9)
+        return {
+            "path":             self.path,
+            "speed":            self.speed,
+            "running":          self.finished_at is None,
+            "points":           self.points,
+            "elapsed_s":        round(elapsed, 3),
+            "throughput_pps":   round(self.points / elapsed, 2),
+            "lag_avg_ms":       round(self.lag_total_ms / max(self.points, 1), 3),
+            "lag_max_ms":       round(self.lag_max_ms, 3),
+            "queue_avg_ms":     round(self.queue_total_ms / max(self.points, 1), 3),
+            "queue_max_ms":     round(self.queue_max_ms, 3),
+            "error":            self.error,
+        }
+
+
+async def replay(path, process, speed=1.0, stats=None):
+    """
+    Play a recording through `process(sample, ts)` (an async callable that
+    scores and broadcasts one point; ts is the row's epoch seconds).
+    speed = 1.0 → original timing, N → N times faster, 0 → as fast as possible.
+    Original timestamps and row order are preserved.
+
+    End-to-end lag per row = delivery time (when `process` returns) minus
+    due time. The due time is the row's slot on the speed-adjusted timeline,
+    or, at speed 0, the moment the row left the read-ahead queue.
+    Time spent buffered in the read-ahead queue is reported separately.
+    """
+    stats  = stats or ReplayStats(path, speed)
+    reader = None
+    t0_rec = t0_wall = None
+
+    try:
+        reader = RecordingReader(path)
+        async for read_at, sample in reader:
+            dequeued = time.monotonic()
+            ts = timestamp_to_epoch(sample["timestamp"])
+            if t0_rec is None:
+                t0_rec, t0_wall = ts, dequeued
+
+            if speed > 0:
+                due   = t0_wall + (ts - t0_rec) / speed
+                delay = due - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                due = dequeued
+                await asyncio.sleep(0)
+
+            await process(sample, ts)
+            stats.record((time.monotonic() - due) * 1000, (dequeued - read_at) * 1000)
+    except Exception as e:
+        stats.error = str(e)
+        raise
+    finally:
+        if reader:
+            reader.close()
+        stats.finished_at = time.monotonic()
+
+    return stats
@@ -3,12 +3,14 @@ import Header from './components/Header.jsx'
 import Dashboard from './pages/Dashboard.jsx'
 import AlertBanner from './components/AlertBanner.jsx'
 import { useWebSocket } from './hooks/useWebSocket.js'
+import { useFleetSummary } from './hooks/useFleetSummary.js'
 
 export default function App() {
   const {
     isConnected, isConnecting, latestPoint,
     chartData, anomalyLog, stats, currentAlert, nodeStatus
   } = useWebSocket()
+  const fleetSummary = useFleetSummary()
 
   const [dismissed, setDismissed] = useState(false)
 
@@ -44,6 +46,7 @@ export default function App() {
           chartData={chartData}
           anomalyLog={anomalyLog}
           nodeStatus={nodeStatus}
+          fleetSummary={fleetSummary}
         />
       </main>
       <AlertBanner
@@ -13,12 +13,19 @@ const CONNECTIONS = [
   ['NODE-03','NODE-05'],['NODE-03','NODE-06'],
 ]
 
-export default function NodeMap({ nodeStatus }) {
+export default function NodeMap({ nodeStatus, fleetSummary }) {
+  const nodeAgg = fleetSummary?.nodes ?? {}
+
+  // Latest point per node — from the server once the first summary arrives
+  const isAlert = (id) => fleetSummary
+    ? !!nodeAgg[id]?.last.is_anomaly
+    : !!nodeStatus[id]?.is_anomaly
+
   const getColor = (id) => {
-    const s = nodeStatus[id]
-    if (!s) return '#1a2540'
-    if (s.is_anomaly) return '#ff3b5c'
-    if (s.cpu_usage > 80) return '#ffcc00'
+    const cpu = fleetSummary ? nodeAgg[id]?.last.cpu_usage : nodeStatus[id]?.cpu_usage
+    if (cpu === undefined) return '#1a2540'
+    if (isAlert(id)) return '#ff3b5c'
+    if (cpu > 80) return '#ffcc00'
     return '#00ff88'
   }
 
@@ -27,14 +34,14 @@ export default function NodeMap({ nodeStatus }) {
       <div className="flex items-center justify-between mb-3">
         <h3 className="font-display text-xs font-semibold text-[#00d4ff] uppercase tracking-widest">Network Topology</h3>
         <span className="text-xs font-mono text-slate-500">
-          {Object.values(nodeStatus).filter(n => n.is_anomaly).length}/{Object.keys(NODE_POSITIONS).length} ALERT
+          {Object.keys(NODE_POSITIONS).filter(isAlert).length}/{Object.keys(NODE_POSITIONS).length} ALERT
         </span>
       </div>
       <div className="relative w-full" style={{ paddingBottom: '90%' }}>
         <svg className="absolute inset-0 w-full h-full" viewBox="0 0 100 100">
           {CONNECTIONS.map(([n1, n2]) => {
             const p1 = NODE_POSITIONS[n1], p2 = NODE_POSITIONS[n2]
-            const anomaly = nodeStatus[n1]?.is_anomaly || nodeStatus[n2]?.is_anomaly
+            const anomaly = isAlert(n1) || isAlert(n2)
             return (
               <line key={`${n1}-${n2}`} x1={p1.x} y1={p1.y} x2={p2.x} y2={p2.y}
                 stroke={anomaly ? '#ff3b5c' : '#1a2540'}
@@ -49,7 +56,7 @@ export default function NodeMap({ nodeStatus }) {
             const r     = pos.type === 'core' ? 5 : pos.type === 'edge' ? 4 : 3
             return (
               <g key={id}>
-                {nodeStatus[id]?.is_anomaly && (
+                {isAlert(id) && (
                   <circle cx={pos.x} cy={pos.y} r={r+3} fill="none" stroke="#ff3b5c" strokeWidth="0.5" opacity="0.5">
                     <animate attributeName="r"       from={r+2} to={r+6} dur="1.2s" repeatCount="indefinite" />
                     <animate attributeName="opacity" from="0.6" to="0"   dur="1.2s" repeatCount="indefinite" />
@@ -60,6 +67,11 @@ export default function NodeMap({ nodeStatus }) {
                 <text x={pos.x} y={pos.y+r+4} textAnchor="middle" fontSize="3.5" fill="#94a3b8" fontFamily="JetBrains Mono">
                   {pos.label}
                 </text>
+                {nodeAgg[id] && (
+                  <text x={pos.x} y={pos.y+r+7.5} textAnchor="middle" fontSize="2.8" fill="#64748b" fontFamily="JetBrains Mono">
+                    {nodeAgg[id].windows['15m'].anomaly_rate}% /15m
+                  </text>
+                )}
               </g>
             )
           })}
@@ -0,0 +1,40 @@
+import { useState, useEffect, useRef } from 'react'
+
+const WS_URL          = 'ws://localhost:8000/ws/fleet'
+const RECONNECT_DELAY = 5000
+
+export function useFleetSummary() {
+  const [summary, setSummary] = useState(null)
+
+  const ws             = useRef(null)
+  const reconnectTimer = useRef(null)
+  const mountedRef     = useRef(true)
+
+  useEffect(() => {
+    mountedRef.current = true
+
+    const connect = () => {
+      ws.current = new WebSocket(WS_URL)
+
+      ws.current.onmessage = (event) => {
+        if (!mountedRef.current) return
+        try { setSummary(JSON.parse(event.data)) }
+        catch (e) { console.error('Parse error:', e) }
+      }
+
+      ws.current.onclose = () => {
+        if (!mountedRef.current) return
+        reconnectTimer.current = setTimeout(connect, RECONNECT_DELAY)
+      }
+    }
+
+    connect()
+    return () => {
+      mountedRef.current = false
+      clearTimeout(reconnectTimer.current)
+      ws.current?.close()
+    }
+  }, [])
+
+  return summary
+}
@@ -5,7 +5,7 @@ import AnomalyTable from '../components/AnomalyTable.jsx'
 import ModelInfo from '../components/ModelInfo.jsx'
 import { CPUMemoryChart, LatencyChart, AnomalyScoreChart } from '../components/TelemetryChart.jsx'
 
-export default function Dashboard({ data, chartData, anomalyLog, nodeStatus }) {
+export default function Dashboard({ data, chartData, anomalyLog, nodeStatus, fleetSummary }) {
 
   const handleExport = () => {
     fetch('/api/anomalies/export')
@@ -60,7 +60,7 @@ export default function Dashboard({ data, chartData, anomalyLog, nodeStatus }) {
 
       {/* ROW 3 — NodeMap + ModelInfo + AnomalyTable (fills remaining height) */}
       <div className="flex-1 min-h-0 grid grid-cols-12 gap-2">
-        <div className="col-span-3 min-h-0"><NodeMap nodeStatus={nodeStatus} /></div>
+        <div className="col-span-3 min-h-0"><NodeMap nodeStatus={nodeStatus} fleetSummary={fleetSummary} /></div>
         <div className="col-span-3 min-h-0"><ModelInfo /></div>
         <div className="col-span-6 min-h-0 h-full"><AnomalyTable anomalies={anomalyLog} onExport={handleExport} /></div>
       </div>